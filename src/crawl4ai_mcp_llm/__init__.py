@@ -3,11 +3,11 @@ import os
 import sys
 
 os.environ["PYTHONIOENCODING"] = "utf-8"
-try:
-    # Force UTF-8 usage for stdout/stderr
-    if sys.stdout.encoding != "utf-8":
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
-    if sys.stderr.encoding != "utf-8":
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
-except AttributeError:
-    pass
+# Force UTF-8 usage for stdout/stderr, in place, keeping each stream's buffering
+for _stream in (sys.stdout, sys.stderr):
+    try:
+        if _stream.encoding != "utf-8":
+            _stream.reconfigure(encoding="utf-8", errors="replace")
+    except (AttributeError, io.UnsupportedOperation):
+        pass
+del _stream
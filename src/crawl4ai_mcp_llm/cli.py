@@ -1,7 +1,8 @@
+import argparse
+import importlib.util
 import os
 import sys
 import traceback
-import click
 import anyio
 import uvicorn
 from starlette.applications import Starlette
@@ -40,26 +41,30 @@ def run_stdio_server(app: Server):
                 streams[0], streams[1], app.create_initialization_options()
             )
 
-    anyio.run(arun)
+    # Use uvloop's faster event loop when it is installed (not available on Windows)
+    use_uvloop = sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None
+    anyio.run(arun, backend_options={"use_uvloop": use_uvloop})
 
-@click.command()
-@click.option("--port", default=8000, help="Port to listen on for SSE")
-@click.option(
-    "--transport",
-    type=click.Choice(["stdio", "sse"]),
-    default="stdio",
-    help="Transport type",
-)
-def main(port: int, transport: str) -> int:
-    if transport == "sse":
-        run_sse_server(app, port)
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="crawl4ai-mcp-llm")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on for SSE")
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "sse"],
+        default="stdio",
+        help="Transport type",
+    )
+    args = parser.parse_args(argv)
+
+    if args.transport == "sse":
+        run_sse_server(app, args.port)
     else:
         run_stdio_server(app)
     return 0
 
 if __name__ == "__main__":
     try:
-        main()
+        sys.exit(main())
     except Exception as e:
         print(f"Main error: {e}", file=sys.stderr)
         print(traceback.format_exc(), file=sys.stderr)
@@ -1,14 +1,11 @@
 import os
 import re
 import sys
+import time
 import traceback
 from datetime import datetime
 import anyio
 
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig
-from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
-from crawl4ai.deep_crawling import BFSDeepCrawlStrategy
-
 from .utils import (
     generate_filename_from_url,
     get_results_directory,
@@ -19,6 +16,16 @@ from .utils import (
 # Environment variable to allow custom JavaScript execution
 CRAWL4AI_MCP_ALLOW_JS_ENV = "CRAWL4AI_MCP_ALLOW_JS"
 
+# Buffer size for the markdown output file: pages are streamed to disk as
+# they are formatted, so a large buffer keeps the number of writes low.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Upper bound for max_concurrency: every permit is a browser tab
+MAX_CONCURRENCY_LIMIT = 20
+
+# Closes the "## Content" section of every page
+MARKDOWN_PAGE_FOOTER = "\n\n---\n"
+
 # Pre-compiled regex for performance optimization.
 # Anchored to full title to avoid false positives on legitimate content
 # (e.g. an article titled "Understanding HTTP 404 errors").
@@ -27,6 +34,96 @@ ERROR_INDICATORS_REGEX = re.compile(
     re.IGNORECASE,
 )
 
+# Server error pages (e.g. nginx) are tiny, so their status line is always
+# near the start of the content: only scan that prefix.
+ERROR_PAGE_REGEX = re.compile(r"404 Not Found|403 Forbidden")
+ERROR_PAGE_SCAN_LIMIT = 4096
+
+
+def _is_browser_alive(crawler) -> bool:
+    """
+    Whether a started crawler's browser can still be used. crawl4ai turns
+    browser failures into unsuccessful results instead of raising, so a
+    crashed browser is only visible through its connection state.
+    """
+    strategy = getattr(crawler, "crawler_strategy", None)
+    manager = getattr(strategy, "browser_manager", None)
+    if manager is None:
+        # Not a browser-based strategy: nothing to check
+        return True
+    browser = manager.browser
+    if browser is None:
+        # Persistent contexts have no separate Browser object
+        return manager.default_context is not None
+    return browser.is_connected()
+
+
+class SharedCrawler:
+    """
+    AsyncWebCrawler started on first use and reused across crawls, so the
+    browser, its connections and its sessions survive between tool calls.
+    A browser found disconnected is retired and closed once unused.
+    """
+
+    def __init__(self):
+        self._crawler = None
+        # In-flight crawls per crawler instance (keyed by id)
+        self._users = {}
+        self._lock = anyio.Lock()
+
+    async def arun(self, url: str, config):
+        retired = None
+        async with self._lock:
+            if self._crawler is not None and not _is_browser_alive(self._crawler):
+                retired, self._crawler = self._crawler, None
+                if id(retired) in self._users:
+                    # Still in use: its last crawl closes it
+                    retired = None
+            if self._crawler is None:
+                from crawl4ai import AsyncWebCrawler
+
+                crawler = AsyncWebCrawler()
+                await crawler.__aenter__()
+                self._crawler = crawler
+            crawler = self._crawler
+            self._users[id(crawler)] = self._users.get(id(crawler), 0) + 1
+
+        if retired is not None:
+            await self._close_crawler(retired)
+
+        try:
+            return await crawler.arun(url, config=config)
+        finally:
+            await self._release(crawler)
+
+    async def _release(self, crawler):
+        """Drop one user of crawler and close it if it is retired and unused."""
+        # Shielded: a cancelled crawl (e.g. a client timeout) must still give
+        # back its slot, otherwise the browser is never closed
+        with anyio.CancelScope(shield=True):
+            async with self._lock:
+                remaining = self._users[id(crawler)] - 1
+                if remaining:
+                    self._users[id(crawler)] = remaining
+                    return
+                del self._users[id(crawler)]
+                if crawler is self._crawler:
+                    return
+            await crawler.__aexit__(None, None, None)
+
+    async def _close_crawler(self, crawler):
+        with anyio.CancelScope(shield=True):
+            await crawler.__aexit__(None, None, None)
+
+    async def close(self):
+        """Retire the current crawler; it is closed now or when its last crawl ends."""
+        with anyio.CancelScope(shield=True):
+            async with self._lock:
+                crawler, self._crawler = self._crawler, None
+                in_use = crawler is not None and id(crawler) in self._users
+        if crawler is not None and not in_use:
+            await self._close_crawler(crawler)
+
 
 def _empty_stats() -> dict:
     """Return a fresh empty stats dict (avoid duplication across error paths)."""
@@ -50,9 +147,12 @@ async def crawl_and_output_to_markdown(
     js_code: str = None,
     session_id: str = None,
     delay_before_return_html: float = None,
+    max_concurrency: int = 5,
+    shared_crawler: SharedCrawler = None,
 ) -> dict:
     """
-    Crawl a website and save the results to a file
+    Crawl a website and save the results to a file.
+    Uses shared_crawler when given, otherwise a crawler for this call only.
     """
     # Validate max_depth: 0 is ambiguous with BFSDeepCrawlStrategy and could
     # lead to unexpected crawling behavior. Enforce a minimum of 1 (single page).
@@ -71,6 +171,27 @@ async def crawl_and_output_to_markdown(
             "stats": _empty_stats(),
         }
 
+    try:
+        max_concurrency = int(max_concurrency)
+    except (TypeError, ValueError):
+        return {
+            "error": f"max_concurrency must be an integer, got: {max_concurrency!r}",
+            "file_path": None,
+            "stats": _empty_stats(),
+        }
+    if max_concurrency < 1:
+        return {
+            "error": f"max_concurrency must be >= 1 (got {max_concurrency}).",
+            "file_path": None,
+            "stats": _empty_stats(),
+        }
+    if max_concurrency > MAX_CONCURRENCY_LIMIT:
+        return {
+            "error": f"max_concurrency must be <= {MAX_CONCURRENCY_LIMIT} (got {max_concurrency}).",
+            "file_path": None,
+            "stats": _empty_stats(),
+        }
+
     results_dir = get_results_directory()
 
     # Generate a filename if not specified
@@ -88,6 +209,12 @@ async def crawl_and_output_to_markdown(
                 "stats": _empty_stats(),
             }
 
+    # crawl4ai is heavy to import (lxml, playwright, ...): load it on the first
+    # crawl so that starting the server and listing tools stays fast
+    from crawl4ai import AsyncWebCrawler, CrawlerRunConfig
+    from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
+    from crawl4ai.deep_crawling import BFSDeepCrawlStrategy
+
     # Set basic configuration
     config = CrawlerRunConfig(
         deep_crawl_strategy=BFSDeepCrawlStrategy(
@@ -97,6 +224,10 @@ async def crawl_and_output_to_markdown(
         scraping_strategy=LXMLWebScrapingStrategy(),
         verbose=verbose,
         magic=magic,
+        # Bounds the pages fetched in parallel for each BFS level. On top of
+        # this cap, arun_many's rate limiter backs off per domain on 429/503
+        # and relaxes again on success.
+        semaphore_count=max_concurrency,
     )
 
     if wait_for_selector:
@@ -117,15 +248,18 @@ async def crawl_and_output_to_markdown(
         config.delay_before_return_html = delay_before_return_html
 
     try:
-        async with AsyncWebCrawler() as crawler:
-            results = await crawler.arun(start_url, config=config)
-            print(f"Crawled {len(results)} pages in total")
-            
-            # Create the parent folder if necessary
-            await anyio.Path(os.path.dirname(os.path.abspath(output_file))).mkdir(parents=True, exist_ok=True)
-            
-            # Call results_to_markdown and get the result
-            return await results_to_markdown(results, output_file)
+        if shared_crawler is not None:
+            results = await shared_crawler.arun(start_url, config=config)
+        else:
+            async with AsyncWebCrawler() as crawler:
+                results = await crawler.arun(start_url, config=config)
+        print(f"Crawled {len(results)} pages in total", file=sys.stderr)
+
+        # Create the parent folder if necessary
+        await anyio.Path(os.path.dirname(os.path.abspath(output_file))).mkdir(parents=True, exist_ok=True)
+
+        # Call results_to_markdown and get the result
+        return await results_to_markdown(results, output_file, verbose=verbose)
     except Exception as e:
         print(f"Error during crawling: {e}", file=sys.stderr)
         print(traceback.format_exc(), file=sys.stderr)
@@ -145,56 +279,59 @@ def _extract_page_content_and_errors(result) -> tuple[str | None, str | None]:
         return None, "missing"
         
     status_code = getattr(result, "status_code", None)
-    if status_code:
+    if status_code is not None:
         if status_code == 404:
             return text_for_output, "404"
         elif status_code in (401, 403):
             return text_for_output, "403"
-
-    # Fallback: Check if it's an error page (404 or 403)
-    if ("404 Not Found" in text_for_output or "403 Forbidden" in text_for_output) and "nginx" in text_for_output:
-        error_type = "404" if "404 Not Found" in text_for_output else "403"
-        return text_for_output, error_type
+    else:
+        # Fallback when no status code is available: check if it's an error page (404 or 403)
+        error_match = ERROR_PAGE_REGEX.search(text_for_output, 0, ERROR_PAGE_SCAN_LIMIT)
+        if error_match and text_for_output.find("nginx", 0, ERROR_PAGE_SCAN_LIMIT) != -1:
+            return text_for_output, error_match.group(0)[:3]
 
     # Check metadata title for error indicators
-    title = result.metadata.get("title", "Untitled page") if hasattr(result, "metadata") and result.metadata and result.metadata.get("title") is not None else "Untitled page"
-    if title and ERROR_INDICATORS_REGEX.search(str(title)):
-        error_type = "404" if "404" in str(title) or "Not Found" in str(title) else "403"
+    metadata = getattr(result, "metadata", None) or {}
+    title = str(metadata.get("title") or "")
+    if title and ERROR_INDICATORS_REGEX.search(title):
+        error_type = "404" if "404" in title or "Not Found" in title else "403"
         # We still want to use the text but note it's an error
         return text_for_output, error_type
 
     return text_for_output, None
 
-def _format_markdown_page(result, text_for_output: str) -> str:
+def _markdown_page_parts(result, text_for_output: str, timestamp: str = None) -> tuple[str, str, str]:
     """
-    Format a single crawl result into a Markdown string.
+    Split a formatted page into (header, cleaned content, footer) so that the
+    potentially large content can be written without being copied into a page string.
     """
     # Remove links from Markdown text
     clean_text = remove_links_from_markdown(text_for_output)
 
-    # Structuring metadata
-    metadata = {
-        "depth": result.metadata.get("depth", "N/A") if hasattr(result, "metadata") else "N/A",
-        "timestamp": datetime.now().isoformat(),
-        "title": result.metadata.get("title", "Untitled page") if hasattr(result, "metadata") else "Untitled page",
-    }
+    # Look the metadata up once; the f-string below reads fields directly
+    metadata = getattr(result, "metadata", None) or {}
 
     # Formatted writing with literal template
-    return f"""
-# {metadata["title"]}
+    header = f"""
+# {metadata.get("title", "Untitled page")}
 
 ## URL
 {result.url}
 
 ## Metadata
-- Depth: {metadata["depth"]}
-- Timestamp: {metadata["timestamp"]}
+- Depth: {metadata.get("depth", "N/A")}
+- Timestamp: {timestamp or datetime.now().isoformat()}
 
 ## Content
-{clean_text}
-
----
 """
+    return header, clean_text, MARKDOWN_PAGE_FOOTER
+
+def _format_markdown_page(result, text_for_output: str, timestamp: str = None) -> str:
+    """
+    Format a single crawl result into a Markdown string.
+    The timestamp defaults to now; callers formatting many pages pass one shared value.
+    """
+    return "".join(_markdown_page_parts(result, text_for_output, timestamp))
 
 def _extract_unique_links(results: list) -> dict:
     """
@@ -204,66 +341,86 @@ def _extract_unique_links(results: list) -> dict:
     seen_hrefs = {"internal": set(), "external": set()}
 
     for result in results:
-        if hasattr(result, "links") and isinstance(result.links, dict):
+        result_links = getattr(result, "links", None)
+        if isinstance(result_links, dict):
             for k in ["internal", "external"]:
-                if k in result.links:
-                    for link in result.links[k]:
-                        # avoid duplicates based on href
-                        href = link.get('href')
-                        if href and href not in seen_hrefs[k]:
-                            links[k].append(link)
-                            seen_hrefs[k].add(href)
+                kept, seen = links[k], seen_hrefs[k]
+                for link in result_links.get(k, ()):
+                    # avoid duplicates based on href
+                    href = link.get('href')
+                    if href and href not in seen:
+                        kept.append(link)
+                        seen.add(href)
 
     return links
 
-async def results_to_markdown(results: list, output_path: str) -> dict:
+def _write_markdown_pages(results: list, md_file, stats: dict, verbose: bool = True) -> list[str]:
+    """
+    Classify, format and write every page to an open text file, updating stats.
+    Synchronous on purpose: it runs in a worker thread. Returns the per-page
+    log lines, which are only collected in verbose mode.
+    """
+    # All pages are already crawled: compute the timestamp once for the whole file
+    timestamp = datetime.now().isoformat()
+    # Per-page log lines are collected and written to stderr in one call
+    log_lines = []
+
+    # Count in locals and store into stats once (also on a write error)
+    successful = failed = not_found = forbidden = 0
+    try:
+        for result in results:
+            text_for_output, error_type = _extract_page_content_and_errors(result)
+
+            if error_type == "missing":
+                if verbose:
+                    log_lines.append(f"No content found for {result.url} - Skipped")
+                failed += 1
+                continue
+            elif error_type in ("404", "403"):
+                if verbose:
+                    log_lines.append(f"{error_type} page detected and skipped: {result.url}")
+                if error_type == "404":
+                    not_found += 1
+                else:
+                    forbidden += 1
+                continue
+
+            md_file.writelines(_markdown_page_parts(result, text_for_output, timestamp))
+            successful += 1
+    finally:
+        stats["successful_pages"] += successful
+        stats["failed_pages"] += failed
+        stats["not_found_pages"] += not_found
+        stats["forbidden_pages"] += forbidden
+
+    return log_lines
+
+async def results_to_markdown(results: list, output_path: str, verbose: bool = True) -> dict:
     """
     Convert crawl results to a markdown file
     """
-    stats = {
-        "successful_pages": 0,
-        "failed_pages": 0,
-        "not_found_pages": 0,
-        "forbidden_pages": 0,
-        "start_time": datetime.now()
-    }
-    
+    stats = _empty_stats()
+    start_time = time.monotonic()
+
     try:
-        async with await anyio.Path(output_path).open("w", encoding="utf-8") as md_file:
-            for result in results:
-                text_for_output, error_type = _extract_page_content_and_errors(result)
-
-                if error_type == "missing":
-                    print(f"No content found for {result.url} - Skipped")
-                    stats["failed_pages"] += 1
-                    continue
-                elif error_type in ("404", "403"):
-                    # For title errors, original code prints slightly differently
-                    title = result.metadata.get("title", "Untitled page") if hasattr(result, "metadata") and result.metadata and result.metadata.get("title") is not None else "Untitled page"
-                    if title and ERROR_INDICATORS_REGEX.search(str(title)):
-                        print(f"Page with error title detected and skipped: {result.url}")
-                    else:
-                        print(f"{error_type} page detected and skipped: {result.url}")
-
-                    if error_type == "404":
-                        stats["not_found_pages"] += 1
-                    else:
-                        stats["forbidden_pages"] += 1
-                    continue
-
-                md_content = _format_markdown_page(result, text_for_output)
-                await md_file.write(md_content)
-                stats["successful_pages"] += 1
-            
-            # Display a summary at the end
-            print(f"Valid pages processed: {stats['successful_pages']}")
-            print(f"Error pages (403/404) skipped: {stats['not_found_pages'] + stats['forbidden_pages']}")
-        
+        async with await anyio.Path(output_path).open(
+            "w", encoding="utf-8", errors="replace", buffering=OUTPUT_BUFFER_SIZE
+        ) as md_file:
+            # Link stripping is CPU-bound: format and write all pages in a
+            # single worker thread so the event loop stays responsive
+            log_lines = await anyio.to_thread.run_sync(
+                _write_markdown_pages, results, md_file.wrapped, stats, verbose
+            )
+
+        # Display a summary at the end
+        log_lines.append(f"Valid pages processed: {stats['successful_pages']}")
+        log_lines.append(f"Error pages (403/404) skipped: {stats['not_found_pages'] + stats['forbidden_pages']}")
+        sys.stderr.write("\n".join(log_lines) + "\n")
+
         links = _extract_unique_links(results)
 
         # Finalize statistics
-        stats["end_time"] = datetime.now()
-        stats["duration_seconds"] = (stats["end_time"] - stats["start_time"]).total_seconds()
+        stats["duration_seconds"] = time.monotonic() - start_time
         
         return {
             "file_path": output_path,
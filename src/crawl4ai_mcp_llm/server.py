@@ -1,13 +1,35 @@
 import sys
 import traceback
+from contextlib import asynccontextmanager
 import anyio
 import mcp.types as types
 from mcp.server.lowlevel import Server
 
-from .crawler import crawl_and_output_to_markdown, CRAWL4AI_MCP_ALLOW_JS_ENV
+from .crawler import (
+    crawl_and_output_to_markdown,
+    SharedCrawler,
+    CRAWL4AI_MCP_ALLOW_JS_ENV,
+    MAX_CONCURRENCY_LIMIT,
+)
 from .utils import sanitize_for_display
 
-app = Server("mcp-web-crawler")
+@asynccontextmanager
+async def server_lifespan(_server: Server):
+    """Share one crawler across the tool calls of a session, closed at shutdown."""
+    shared_crawler = SharedCrawler()
+    try:
+        yield {"crawler": shared_crawler}
+    finally:
+        await shared_crawler.close()
+
+app = Server("mcp-web-crawler", lifespan=server_lifespan)
+
+def _session_crawler() -> SharedCrawler | None:
+    """Return the session's shared crawler, or None outside an MCP request."""
+    try:
+        return app.request_context.lifespan_context["crawler"]
+    except LookupError:
+        return None
 
 @app.call_tool()
 async def crawl_tool(
@@ -29,6 +51,7 @@ async def crawl_tool(
     js_code = arguments.get("js_code", None)
     session_id = arguments.get("session_id", None)
     delay_before_return_html = arguments.get("delay_before_return_html", None)
+    max_concurrency = arguments.get("max_concurrency", 5)
 
     # Runtime type coercion: MCP clients (LLMs) may send strings instead of
     # the declared JSON-schema types. Cast defensively to avoid cryptic
@@ -39,6 +62,12 @@ async def crawl_tool(
         raise ValueError(
             f"max_depth must be an integer, got: {max_depth!r}"
         )
+    try:
+        max_concurrency = int(max_concurrency)
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"max_concurrency must be an integer, got: {max_concurrency!r}"
+        )
     include_external = bool(include_external)
     verbose = bool(verbose)
     return_content = bool(return_content)
@@ -64,6 +93,8 @@ async def crawl_tool(
             js_code=js_code,
             session_id=session_id,
             delay_before_return_html=delay_before_return_html,
+            max_concurrency=max_concurrency,
+            shared_crawler=_session_crawler(),
         )
 
         if result["error"]:
@@ -79,26 +110,28 @@ async def crawl_tool(
             internal_links = [link.get("href") for link in result["links"].get("internal", [])[:20]]
             external_links = [link.get("href") for link in result["links"].get("external", [])[:20]]
             if internal_links or external_links:
-                links_summary = "\n## Extracted Links (Sample)"
+                summary_parts = ["\n## Extracted Links (Sample)"]
                 if internal_links:
-                    links_summary += "\n### Internal Links\n- " + "\n- ".join(internal_links)
+                    summary_parts.append("\n### Internal Links\n- " + "\n- ".join(internal_links))
                 if external_links:
-                    links_summary += "\n### External Links\n- " + "\n- ".join(external_links)
-                links_summary += "\n"
+                    summary_parts.append("\n### External Links\n- " + "\n- ".join(external_links))
+                summary_parts.append("\n")
+                links_summary = "".join(summary_parts)
 
         content_text = ""
         if return_content and file_path:
             try:
+                max_chars = 50000
+                # Only read what can be returned instead of the whole crawl output
                 async with await anyio.Path(file_path).open("r", encoding="utf-8") as f:
-                    content_text = await f.read()
+                    content_text = await f.read(max_chars + 1)
 
-                max_chars = 50000
                 if len(content_text) > max_chars:
                     content_text = content_text[:max_chars] + "\n\n...[Content truncated due to length]..."
 
                 content_text = f"\n\n## Extracted Content\n\n{content_text}"
             except Exception as e:
-                print(f"Failed to read content for return: {e}")
+                print(f"Failed to read content for return: {e}", file=sys.stderr)
 
         summary = f"""
 ## Crawl completed successfully
@@ -195,6 +228,13 @@ async def list_tools() -> list[types.Tool]:
                         "type": "number",
                         "description": "Delay in seconds to wait before extracting HTML (useful for heavy JS pages)",
                     },
+                    "max_concurrency": {
+                        "type": "integer",
+                        "description": "Maximum number of pages crawled in parallel",
+                        "default": 5,
+                        "minimum": 1,
+                        "maximum": MAX_CONCURRENCY_LIMIT,
+                    },
                 },
             },
         )
@@ -1,3 +1,4 @@
+import functools
 import os
 import re
 import sys
@@ -36,6 +37,10 @@ UNICODE_REPLACEMENTS = {
     "\u00a0": " ",   # Non-breaking space   becomes normal space
 }
 
+# Single-pass translation table built from UNICODE_REPLACEMENTS
+UNICODE_TRANSLATION_TABLE = str.maketrans(UNICODE_REPLACEMENTS)
+NON_ASCII_REGEX = re.compile(r"[^\x00-\x7F]+")
+
 def sanitize_for_display(text):
     """
     Sanitize text for safe display in MCP responses (e.g. error messages).
@@ -57,15 +62,12 @@ def sanitize_for_display(text):
         # Test if the text can be encoded in the default system encoding
         text.encode(sys.getdefaultencoding())
     except UnicodeEncodeError:
-        # If it can't, replace problematic characters
-        # Apply explicit replacements
-        for char, replacement in UNICODE_REPLACEMENTS.items():
-            if char in text:
-                text = text.replace(char, replacement)
+        # If it can't, apply explicit replacements in a single pass
+        text = text.translate(UNICODE_TRANSLATION_TABLE)
 
         # Eliminate all other non-ASCII characters that might cause problems
         if not text.isascii():
-            text = re.sub(r"[^\x00-\x7F]+", " ", text)
+            text = NON_ASCII_REGEX.sub(" ", text)
 
     return text
 
@@ -90,12 +92,14 @@ def get_results_directory():
     else:
         results_dir = os.path.expanduser("~/.crawl4ai_mcp_llm/results")
 
-    # Create the folder if it doesn't exist
-    if not os.path.exists(results_dir):
-        os.makedirs(results_dir)
-
+    _ensure_directory(results_dir)
     return results_dir
 
+@functools.lru_cache(maxsize=None)
+def _ensure_directory(path):
+    """Create a directory once per process; later calls are a cache hit"""
+    os.makedirs(path, exist_ok=True)
+
 def is_safe_path(path, base_dir):
     """Checks if a path is safe (i.e., within the base directory)"""
     # Use realpath to resolve any symlinks and .. components
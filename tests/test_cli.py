@@ -0,0 +1,13 @@
+from unittest.mock import patch
+
+from crawl4ai_mcp_llm.cli import main
+
+@patch("crawl4ai_mcp_llm.cli.run_stdio_server")
+def test_main_defaults_to_stdio(mock_run_stdio):
+    assert main([]) == 0
+    mock_run_stdio.assert_called_once()
+
+@patch("crawl4ai_mcp_llm.cli.run_sse_server")
+def test_main_sse_with_port(mock_run_sse):
+    assert main(["--transport", "sse", "--port", "9000"]) == 0
+    assert mock_run_sse.call_args.args[1] == 9000
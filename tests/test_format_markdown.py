@@ -79,5 +79,15 @@ class TestFormatMarkdownPage(unittest.TestCase):
         # Verify the original image markdown is gone
         self.assertNotIn("![image](https://example.com/img.png)", result_str)
 
+    @patch("crawl4ai_mcp_llm.crawler.datetime")
+    def test_format_markdown_page_shared_timestamp(self, mock_datetime):
+        """Test that an explicit timestamp is used instead of the current time."""
+        result_str = _format_markdown_page(
+            self.mock_result, self.text_content, "2024-01-01T00:00:00"
+        )
+
+        self.assertIn("- Timestamp: 2024-01-01T00:00:00", result_str)
+        mock_datetime.now.assert_not_called()
+
 if __name__ == "__main__":
     unittest.main()
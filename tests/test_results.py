@@ -74,6 +74,25 @@ async def test_results_to_markdown_with_errors():
         if os.path.exists(output_path):
             os.remove(output_path)
 
+@pytest.mark.anyio
+async def test_results_to_markdown_quiet(capsys):
+    results = [MockResult(1), MockResult(2, error_type="missing")]
+    output_path = "test_output_quiet.md"
+
+    try:
+        res = await results_to_markdown(results, output_path, verbose=False)
+
+        assert res["stats"]["successful_pages"] == 1
+        assert res["stats"]["failed_pages"] == 1
+        # The summary is still logged, per-page messages are not
+        err = capsys.readouterr().err
+        assert "Valid pages processed: 1" in err
+        assert "No content found" not in err
+
+    finally:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+
 @pytest.mark.anyio
 async def test_results_to_markdown_exception():
     results = [MockResult(1)]
@@ -113,6 +132,27 @@ def test_extract_page_content_and_errors_403_text_with_nginx():
     assert content == "An error occurred: 403 Forbidden nginx"
     assert error_type == "403"
 
+def test_extract_page_content_and_errors_error_text_beyond_scan_limit():
+    class MockResultLongPage:
+        markdown = "x" * 5000 + " 404 Not Found nginx"
+        metadata = {"title": "Normal Title", "depth": 1}
+
+    result = MockResultLongPage()
+    content, error_type = _extract_page_content_and_errors(result)
+    assert content == MockResultLongPage.markdown
+    assert error_type is None
+
+def test_extract_page_content_and_errors_status_code_skips_body_scan():
+    class MockResultWithStatus:
+        markdown = "Docs page quoting a 404 Not Found nginx response"
+        status_code = 200
+        metadata = {"title": "Normal Title", "depth": 1}
+
+    result = MockResultWithStatus()
+    content, error_type = _extract_page_content_and_errors(result)
+    assert content == MockResultWithStatus.markdown
+    assert error_type is None
+
 def test_extract_page_content_and_errors_404_title():
     class MockResultTitleError:
         markdown = "Some normal looking content without the n word"
@@ -167,7 +207,7 @@ async def test_crawl_and_output_to_markdown_exception():
         async def arun(self, url, **kwargs):
             raise Exception("Simulated crawl error")
 
-    with patch("crawl4ai_mcp_llm.crawler.AsyncWebCrawler", return_value=MockCrawlerContext()):
+    with patch("crawl4ai.AsyncWebCrawler", return_value=MockCrawlerContext()):
         result = await crawl_and_output_to_markdown("https://example.com")
 
         assert "error" in result
@@ -198,7 +238,7 @@ async def test_crawl_and_output_to_markdown_new_params():
 
     mock_crawler = MockCrawlerContext()
 
-    with patch("crawl4ai_mcp_llm.crawler.AsyncWebCrawler", return_value=mock_crawler):
+    with patch("crawl4ai.AsyncWebCrawler", return_value=mock_crawler):
         # We need to mock anyio.Path.mkdir and results_to_markdown to avoid disk operations
         with patch.dict("os.environ", {"CRAWL4AI_MCP_ALLOW_JS": "true"}):
             with patch("anyio.Path.mkdir", new_callable=AsyncMock):
@@ -212,6 +252,7 @@ async def test_crawl_and_output_to_markdown_new_params():
                         js_code="console.log('test');",
                         session_id="test_session",
                         delay_before_return_html=2.5,
+                        max_concurrency=3,
                     )
 
                     assert mock_crawler.captured_config is not None
@@ -220,3 +261,19 @@ async def test_crawl_and_output_to_markdown_new_params():
                     assert mock_crawler.captured_config.js_code == "console.log('test');"
                     assert mock_crawler.captured_config.session_id == "test_session"
                     assert mock_crawler.captured_config.delay_before_return_html == 2.5
+                    assert mock_crawler.captured_config.semaphore_count == 3
+
+@pytest.mark.anyio
+async def test_crawl_and_output_to_markdown_invalid_max_concurrency():
+    result = await crawl_and_output_to_markdown("https://example.com", max_concurrency=0)
+
+    assert result["error"] == "max_concurrency must be >= 1 (got 0)."
+    assert result["file_path"] is None
+
+@pytest.mark.anyio
+async def test_crawl_and_output_to_markdown_max_concurrency_too_high():
+    result = await crawl_and_output_to_markdown("https://example.com", max_concurrency=10000)
+
+    assert result["error"] == "max_concurrency must be <= 20 (got 10000)."
+    assert result["file_path"] is None
+    assert result["stats"]["successful_pages"] == 0
@@ -0,0 +1,21 @@
+import os
+from unittest.mock import patch
+
+from crawl4ai_mcp_llm.utils import get_results_directory
+
+def test_results_directory_from_env(tmp_path, monkeypatch):
+    results_dir = tmp_path / "results"
+    monkeypatch.setenv("CRAWL4AI_RESULTS_DIR", str(results_dir))
+
+    assert get_results_directory() == str(results_dir)
+    assert os.path.isdir(results_dir)
+
+def test_results_directory_created_once(tmp_path, monkeypatch):
+    results_dir = tmp_path / "cached"
+    monkeypatch.setenv("CRAWL4AI_RESULTS_DIR", str(results_dir))
+
+    with patch("crawl4ai_mcp_llm.utils.os.makedirs", wraps=os.makedirs) as mock_makedirs:
+        get_results_directory()
+        get_results_directory()
+
+    mock_makedirs.assert_called_once_with(str(results_dir), exist_ok=True)
@@ -0,0 +1,42 @@
+import unittest
+import sys
+
+# Ensure src is in path
+if "src" not in sys.path:
+    sys.path.insert(0, "src")
+
+from crawl4ai_mcp_llm.utils import sanitize_for_display
+
+class TestSanitizeForDisplay(unittest.TestCase):
+    """
+    Test suite for the sanitize_for_display function.
+    """
+
+    def test_none_and_non_string(self):
+        """Test that None and non-string inputs are coerced."""
+        self.assertEqual(sanitize_for_display(None), "")
+        self.assertEqual(sanitize_for_display(404), "404")
+
+    def test_ascii_text_is_returned_as_is(self):
+        """Test that ASCII input takes the fast path and is not copied."""
+        text = "Plain ASCII error message"
+        self.assertIs(sanitize_for_display(text), text)
+
+    def test_encodable_text_is_unchanged(self):
+        """Test that text encodable in the default encoding is kept as-is."""
+        text = "Café → menu"
+        self.assertEqual(sanitize_for_display(text), text)
+
+    def test_explicit_replacements(self):
+        """Test that known Unicode characters are replaced by ASCII equivalents."""
+        # A lone surrogate makes the text non-encodable and triggers sanitization
+        text = "‘a’ → b — c… •\ud800"
+        self.assertEqual(sanitize_for_display(text), "'a' -> b -- c... * ")
+
+    def test_remaining_non_ascii_collapsed(self):
+        """Test that runs of unknown non-ASCII characters become a single space."""
+        text = "Caféé ok\ud800"
+        self.assertEqual(sanitize_for_display(text), "Caf  ok ")
+
+if __name__ == "__main__":
+    unittest.main()
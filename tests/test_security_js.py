@@ -36,7 +36,7 @@ class TestSecurityJS(unittest.IsolatedAsyncioTestCase):
             self.assertIn("error", result)
             self.assertIn("Custom JavaScript execution is disabled", result["error"])
 
-    @patch("crawl4ai_mcp_llm.crawler.AsyncWebCrawler")
+    @patch("crawl4ai.AsyncWebCrawler")
     @patch("crawl4ai_mcp_llm.crawler.results_to_markdown")
     async def test_js_code_allowed_when_env_set_to_true(self, mock_results_to_markdown, mock_crawler_class):
         with patch.dict(os.environ, {"CRAWL4AI_MCP_ALLOW_JS": "true"}):
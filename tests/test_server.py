@@ -0,0 +1,46 @@
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+import pytest
+
+from crawl4ai_mcp_llm.crawler import SharedCrawler
+from crawl4ai_mcp_llm.server import app, crawl_tool, server_lifespan
+
+CRAWL_RESULT = {
+    "error": None,
+    "file_path": None,
+    "stats": {
+        "successful_pages": 1,
+        "failed_pages": 0,
+        "not_found_pages": 0,
+        "forbidden_pages": 0,
+        "duration_seconds": 0.5,
+    },
+}
+
+@pytest.mark.anyio
+async def test_crawl_tool_uses_session_crawler():
+    with patch.object(SharedCrawler, "close", new_callable=AsyncMock) as mock_close:
+        async with server_lifespan(app) as lifespan_context:
+            shared_crawler = lifespan_context["crawler"]
+            assert isinstance(shared_crawler, SharedCrawler)
+
+            request_context = MagicMock(lifespan_context=lifespan_context)
+            with patch.object(type(app), "request_context", new_callable=PropertyMock, return_value=request_context):
+                with patch("crawl4ai_mcp_llm.server.crawl_and_output_to_markdown", new_callable=AsyncMock) as mock_crawl:
+                    mock_crawl.return_value = CRAWL_RESULT
+                    response = await crawl_tool("crawl", {"url": "https://example.com"})
+
+            assert "Crawl completed successfully" in response[0].text
+            assert mock_crawl.call_args.kwargs["shared_crawler"] is shared_crawler
+            mock_close.assert_not_awaited()
+
+        # The shared crawler is closed when the session ends
+        mock_close.assert_awaited_once()
+
+@pytest.mark.anyio
+async def test_crawl_tool_without_request_context():
+    with patch("crawl4ai_mcp_llm.server.crawl_and_output_to_markdown", new_callable=AsyncMock) as mock_crawl:
+        mock_crawl.return_value = CRAWL_RESULT
+        response = await crawl_tool("crawl", {"url": "https://example.com"})
+
+    assert "Crawl completed successfully" in response[0].text
+    assert mock_crawl.call_args.kwargs["shared_crawler"] is None
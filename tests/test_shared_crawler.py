@@ -0,0 +1,156 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+import anyio
+import pytest
+
+from crawl4ai_mcp_llm.crawler import SharedCrawler, _is_browser_alive
+
+def _mock_crawler(arun_side_effect=None):
+    crawler = MagicMock()
+    crawler.__aenter__ = AsyncMock(return_value=crawler)
+    crawler.__aexit__ = AsyncMock(return_value=None)
+    crawler.arun = AsyncMock(return_value=[], side_effect=arun_side_effect)
+    crawler.crawler_strategy.browser_manager.browser.is_connected.return_value = True
+    return crawler
+
+def _disconnect(crawler):
+    crawler.crawler_strategy.browser_manager.browser.is_connected.return_value = False
+
+def test_is_browser_alive():
+    crawler = _mock_crawler()
+    assert _is_browser_alive(crawler)
+
+    _disconnect(crawler)
+    assert not _is_browser_alive(crawler)
+
+    # Persistent context: no Browser object, alive while the context exists
+    manager = crawler.crawler_strategy.browser_manager
+    manager.browser = None
+    assert _is_browser_alive(crawler)
+    manager.default_context = None
+    assert not _is_browser_alive(crawler)
+
+@pytest.mark.anyio
+async def test_shared_crawler_started_once():
+    crawler = _mock_crawler()
+    with patch("crawl4ai.AsyncWebCrawler", return_value=crawler) as mock_class:
+        shared = SharedCrawler()
+        await shared.arun("https://example.com/a", config=None)
+        await shared.arun("https://example.com/b", config=None)
+
+        mock_class.assert_called_once()
+        crawler.__aenter__.assert_awaited_once()
+        assert crawler.arun.await_count == 2
+
+        await shared.close()
+        crawler.__aexit__.assert_awaited_once()
+
+@pytest.mark.anyio
+async def test_shared_crawler_restarted_when_browser_disconnected():
+    crashed = _mock_crawler()
+    fresh = _mock_crawler()
+    with patch("crawl4ai.AsyncWebCrawler", side_effect=[crashed, fresh]):
+        shared = SharedCrawler()
+        await shared.arun("https://example.com", config=None)
+
+        _disconnect(crashed)
+        await shared.arun("https://example.com", config=None)
+
+        crashed.__aexit__.assert_awaited_once()
+        fresh.arun.assert_awaited_once()
+        fresh.__aexit__.assert_not_awaited()
+
+@pytest.mark.anyio
+async def test_shared_crawler_kept_after_error():
+    crawler = _mock_crawler(arun_side_effect=[ValueError("Invalid URL"), []])
+    with patch("crawl4ai.AsyncWebCrawler", return_value=crawler) as mock_class:
+        shared = SharedCrawler()
+        with pytest.raises(ValueError):
+            await shared.arun("not a url", config=None)
+        await shared.arun("https://example.com", config=None)
+
+        mock_class.assert_called_once()
+        crawler.__aexit__.assert_not_awaited()
+
+@pytest.mark.anyio
+async def test_shared_crawler_failing_call_does_not_affect_concurrent_call():
+    healthy_started = anyio.Event()
+    finish_healthy = anyio.Event()
+
+    async def fake_arun(url, config=None):
+        if url == "https://example.com/bad":
+            raise ValueError("Invalid selector")
+        healthy_started.set()
+        await finish_healthy.wait()
+        if crawler.__aexit__.await_count:
+            raise RuntimeError("browser closed under me")
+        return ["ok"]
+
+    crawler = _mock_crawler(arun_side_effect=fake_arun)
+    results = {}
+
+    async def run_healthy():
+        results["healthy"] = await shared.arun("https://example.com/good", config=None)
+
+    with patch("crawl4ai.AsyncWebCrawler", return_value=crawler) as mock_class:
+        shared = SharedCrawler()
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(run_healthy)
+            await healthy_started.wait()
+            with pytest.raises(ValueError):
+                await shared.arun("https://example.com/bad", config=None)
+            finish_healthy.set()
+
+        assert results["healthy"] == ["ok"]
+        mock_class.assert_called_once()
+        crawler.__aexit__.assert_not_awaited()
+
+@pytest.mark.anyio
+async def test_shared_crawler_disconnected_browser_closed_after_last_crawl():
+    healthy_started = anyio.Event()
+    finish_healthy = anyio.Event()
+
+    async def fake_arun(url, config=None):
+        healthy_started.set()
+        await finish_healthy.wait()
+        return ["ok"]
+
+    crashed = _mock_crawler(arun_side_effect=fake_arun)
+    fresh = _mock_crawler()
+    results = {}
+
+    async def run_healthy():
+        results["healthy"] = await shared.arun("https://example.com/good", config=None)
+
+    with patch("crawl4ai.AsyncWebCrawler", side_effect=[crashed, fresh]):
+        shared = SharedCrawler()
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(run_healthy)
+            await healthy_started.wait()
+
+            # The browser dies mid-crawl: new crawls get a fresh one, and the
+            # old one stays open for the crawl still using it
+            _disconnect(crashed)
+            await shared.arun("https://example.com/next", config=None)
+            fresh.arun.assert_awaited_once()
+            crashed.__aexit__.assert_not_awaited()
+
+            finish_healthy.set()
+
+    assert results["healthy"] == ["ok"]
+    crashed.__aexit__.assert_awaited_once()
+    fresh.__aexit__.assert_not_awaited()
+
+@pytest.mark.anyio
+async def test_shared_crawler_cancelled_crawl_releases_browser():
+    async def hanging_arun(url, config=None):
+        await anyio.sleep_forever()
+
+    crawler = _mock_crawler(arun_side_effect=hanging_arun)
+    with patch("crawl4ai.AsyncWebCrawler", return_value=crawler):
+        shared = SharedCrawler()
+        # A client timeout cancels the request scope mid-crawl
+        with anyio.move_on_after(0.05):
+            await shared.arun("https://example.com", config=None)
+
+        await shared.close()
+        crawler.__aexit__.assert_awaited_once()